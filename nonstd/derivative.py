@@ -1,21 +1,26 @@
 from typing import Optional
 
-import scipy.misc
+import numpy as np
 
 
 def by_kwarg(f, x0: dict, deriv_dim: str, dx: Optional[float] = None) -> float:
     """
     TODO: add tests
 
-    Wrapper around ``scipy.misc.derivative`` to handle keyword arguments, instead of being limited to positional arguments.
-    Uses currying [0].
+    Central-difference derivative that handles keyword arguments, instead of being limited to
+    positional arguments. Uses currying [0].
+
+    Previously a wrapper around ``scipy.misc.derivative``, which is deprecated (and removed in
+    SciPy 1.12). The 3-point central difference ``(f(x+dx) - f(x-dx)) / (2*dx)`` is computed
+    directly instead. When ``f`` broadcasts elementwise over NumPy arrays, both sample points are
+    evaluated in a single call.
 
     [0]: https://en.wikipedia.org/wiki/Currying
 
     :param f: Function to differentiate
     :param x0: Point at which to differentiate, given as a dict of ``{argument_name: value}``
     :param deriv_dim: The name of dimension along which to differentiate, as a ``str`
-    :param dx: Explicitly set the finite difference passed to SciPy.
+    :param dx: Explicitly set the finite difference.
 
     :return: The derivative of ``f`` with respect to ``deriv_dim`` at ``x0``.
     """
@@ -26,12 +31,19 @@ def by_kwarg(f, x0: dict, deriv_dim: str, dx: Optional[float] = None) -> float:
         else:
             dx = 1e-12
 
+    kwargs = dict(x0)  # Copy, so that we never mutate the caller's ``x0``
+
     def curried_f(x):
         """
         ``f`` expressed as a function of the relevant dimension only
         """
-        kwargs = x0
         kwargs[deriv_dim] = x
         return f(**kwargs)
 
-    return scipy.misc.derivative(curried_f, x0=x0[deriv_dim], dx=dx)
+    x = x0[deriv_dim]
+    try:
+        below, above = curried_f(np.array([x - dx, x + dx]))
+    except (TypeError, ValueError):  # ``f`` does not broadcast over arrays
+        below = curried_f(x - dx)
+        above = curried_f(x + dx)
+    return (above - below) / (2 * dx)
@@ -36,10 +36,13 @@ class _StreamTee:
     def __init__(self, file: TextIO, stream):
         self.file = file
         self.stream = stream
+        # ``write`` is called for every chunk of output; bind the targets' methods once
+        self._file_write = file.write
+        self._stream_write = stream.write
 
     def write(self, data):
-        self.file.write(data)
-        self.stream.write(data)
+        self._file_write(data)
+        self._stream_write(data)
 
     def flush(self):
         self.file.flush()
@@ -1,9 +1,20 @@
+import functools
 from dataclasses import is_dataclass, fields
+
 from pydantic import BaseModel
 import rich
 from rich.syntax import Syntax
 
 
+@functools.lru_cache(maxsize=None)
+def _dataclass_fields(cls):
+    """
+    ``dataclasses.fields`` builds a fresh tuple on every call; the result only depends on the
+    class, so cache it per class.
+    """
+    return fields(cls)
+
+
 def prepr(obj, indent=2, split_str=True, print_rich_theme=None):
     """
     ``prepr`` (pretty repr) returns a string representation of a nested object:
@@ -39,83 +50,99 @@ def prepr(obj, indent=2, split_str=True, print_rich_theme=None):
     :param split_str: Whether to display strings containing newlines on multiple lines.
     """
 
+    # The output is accumulated as a list of fragments and joined once at the end. Building it
+    # with repeated ``result += ...`` would copy the accumulated string on each append, which is
+    # quadratic for large nested objects.
+    parts = []
+
+    # Indentation strings, cached by width: nested structures re-use the same few widths many
+    # times, so don't allocate a fresh whitespace string for each fragment
+    _indents = {}
+
+    def pad(width):
+        s = _indents.get(width)
+        if s is None:
+            s = _indents[width] = " " * width
+        return s
+
     def _repr_nested(obj, level=0):
         if isinstance(obj, str):
-            return print_string(obj, level)
+            print_string(obj, level)
         elif is_dataclass(obj):
-            return repr_dataclass(obj, level)
+            repr_dataclass(obj, level)
         elif isinstance(obj, BaseModel):
-            return repr_pydantic(obj, level)
+            repr_pydantic(obj, level)
         elif isinstance(obj, dict):
-            return repr_dict(obj, level)
+            repr_dict(obj, level)
         elif isinstance(obj, (list, tuple)):
-            return repr_sequence(obj, level)
+            repr_sequence(obj, level)
         else:
-            return repr(obj)
+            parts.append(repr(obj))
 
     def print_string(s, level):
         if "\n" in s and split_str:
-            lines = s.split("\n")
-            result = "\n"
-            for i, line in enumerate(lines):
-                if i == len(lines) - 1 and line == "":
-                    break
-                result += " " * (level + indent) + repr(line + ("\n" if i < len(lines) - 1 else ""))
-                result += "\n"
-            return result.rstrip()
+            # ``splitlines(keepends=True)`` hands back the lines with their terminators already
+            # attached, saving the manual newline re-appending of ``split("\n")``
+            line_pad = pad(level + indent)
+            line_parts = ["\n"]
+            for line in s.splitlines(keepends=True):
+                line_parts.append(line_pad + repr(line) + "\n")
+            parts.append("".join(line_parts).rstrip())
         else:
-            return repr(s)
+            parts.append(repr(s))
 
     def repr_dataclass(obj, level):
         class_name = obj.__class__.__name__
-        if not fields(obj):
-            return f"{class_name}()"
-        result = f"{class_name}(\n"
-        for field in fields(obj):
+        obj_fields = _dataclass_fields(type(obj))
+        if not obj_fields:
+            parts.append(f"{class_name}()")
+            return
+        parts.append(f"{class_name}(\n")
+        for field in obj_fields:
             field_name = field.name
             field_value = getattr(obj, field_name)
-            result += " " * (level + indent) + f"{field_name}="
-            result += _repr_nested(field_value, level + indent)
-            result += ",\n"
-        result += " " * level + ")"
-        return result
+            parts.append(pad(level + indent) + f"{field_name}=")
+            _repr_nested(field_value, level + indent)
+            parts.append(",\n")
+        parts.append(pad(level) + ")")
 
     def repr_pydantic(obj, level):
         class_name = obj.__class__.__name__
         if not obj.__fields__:
-            return f"{class_name}()"
-        result = f"{class_name}(\n"
+            parts.append(f"{class_name}()")
+            return
+        parts.append(f"{class_name}(\n")
         for field_name, field_value in obj:
-            result += " " * (level + indent) + f"{field_name}="
-            result += _repr_nested(field_value, level + indent)
-            result += ",\n"
-        result += " " * level + ")"
-        return result
+            parts.append(pad(level + indent) + f"{field_name}=")
+            _repr_nested(field_value, level + indent)
+            parts.append(",\n")
+        parts.append(pad(level) + ")")
 
     def repr_dict(d, level):
         if not d:
-            return "{}"
-        result = "{\n"
+            parts.append("{}")
+            return
+        parts.append("{\n")
         for key, value in d.items():
-            result += " " * (level + indent) + repr(key) + ": "
-            result += _repr_nested(value, level + indent)
-            result += ",\n"
-        result += " " * level + "}"
-        return result
+            parts.append(pad(level + indent) + repr(key) + ": ")
+            _repr_nested(value, level + indent)
+            parts.append(",\n")
+        parts.append(pad(level) + "}")
 
     def repr_sequence(seq, level):
         if not seq:
-            return "[]" if isinstance(seq, list) else "()"
+            parts.append("[]" if isinstance(seq, list) else "()")
+            return
         bracket = "[]" if isinstance(seq, list) else "()"
-        result = f"{bracket[0]}\n"
+        parts.append(f"{bracket[0]}\n")
         for item in seq:
-            result += " " * (level + indent)
-            result += _repr_nested(item, level + indent)
-            result += ",\n"
-        result += " " * level + f"{bracket[1]}"
-        return result
+            parts.append(pad(level + indent))
+            _repr_nested(item, level + indent)
+            parts.append(",\n")
+        parts.append(pad(level) + f"{bracket[1]}")
 
-    ret = _repr_nested(obj)
+    _repr_nested(obj)
+    ret = "".join(parts)
     if print_rich_theme:
         rich.print(Syntax(ret, "python", theme=print_rich_theme))
     return ret
@@ -2,9 +2,11 @@ import collections.abc
 import contextlib
 import enum
 import math
-from itertools import count
+from itertools import count, repeat, zip_longest
 from math import inf
 from types import FunctionType
+
+import numpy as np
 from typing import Optional, Union, Sequence, Callable
 
 
@@ -20,10 +22,10 @@ class OffsetList(collections.UserList):
         super().__init__(initlist)
 
     def _wrapped_index(self, index: [int, slice]) -> [int, slice]:
+        if isinstance(index, int):  # The common case: check it before the slice case
+            return self._wrapped_integer_index(index)
         if isinstance(index, slice):
             return self._wrapped_slice_index(index)
-        if isinstance(index, int):
-            return self._wrapped_integer_index(index)
 
     def _wrapped_slice_index(self, index: slice) -> slice:
         start = self._wrapped_integer_index(index.start)
@@ -33,31 +35,53 @@ class OffsetList(collections.UserList):
     def _wrapped_integer_index(self, index: [int, None]) -> [int, None]:
         if index is None:
             return None
+        start_i = self.start_i  # Bind to a local: one attribute lookup instead of two
+        # The common case: a single compare and subtract. The ``start_i >= 0`` guard keeps
+        # negative indices counting backwards from the end when the start index is itself
+        # negative (``index >= start_i`` alone would swallow them).
+        if index >= start_i >= 0:
+            return index - start_i
         if (
             index < 0
         ):  # In Python, negative indices are used to count backwards from the last element of a list
             return index
-        elif index < self.start_i:
+        if index < start_i:
             raise IndexError(
                 f"This {self.__class__.__name__} is an `OffsetList` with start index {self.start_i}. Index {index} is forbidden."
             )
-        else:
-            return index - self.start_i
+        return index - start_i
+
+    @classmethod
+    def _from_data(cls, data: list, start_i: int) -> "OffsetList":
+        """
+        Build an ``OffsetList`` taking ownership of ``data``, skipping ``UserList.__init__``'s
+        defensive copy. For internal use on lists we have just built ourselves.
+        """
+        obj = cls.__new__(cls)
+        obj.start_i = start_i
+        obj.data = data
+        return obj
 
     def __getitem__(self, index: [int, slice]) -> any:
+        if isinstance(index, int):
+            # Inline the scalar path: skip the ``_wrapped_index`` dispatch and the
+            # ``UserList.__getitem__`` indirection
+            return self.data[self._wrapped_integer_index(index)]
         wrapped_i = self._wrapped_index(index)
-        if isinstance(index, slice):
-            return OffsetList(start_i=self.start_i, initlist=self.data[wrapped_i])
-        else:
-            return super().__getitem__(wrapped_i)
+        # ``self.data[wrapped_i]`` is already a fresh list; don't copy it a second time
+        return OffsetList._from_data(self.data[wrapped_i], self.start_i)
 
     def __setitem__(self, index: [int, slice], value: any) -> None:
-        wrapped_i = self._wrapped_index(index)
-        super().__setitem__(wrapped_i, value)
+        if isinstance(index, int):
+            self.data[self._wrapped_integer_index(index)] = value
+        else:
+            self.data[self._wrapped_index(index)] = value
 
     def __delitem__(self, index: [int, slice]) -> None:
-        wrapped_i = self._wrapped_index(index)
-        super().__delitem__(wrapped_i)
+        if isinstance(index, int):
+            del self.data[self._wrapped_integer_index(index)]
+        else:
+            del self.data[self._wrapped_index(index)]
 
     def insert(self, index: [int, slice], value: any) -> None:
         wrapped_i = self._wrapped_index(index)
@@ -96,7 +120,12 @@ class OffsetList(collections.UserList):
         return self.data == other.data
 
     def __iter__(self):
-        yield from self.data.__iter__()
+        return iter(self.data)
+
+    def __reversed__(self):
+        # Without this, the `Sequence` mixin's `__reversed__` indexes from 0 and raises on the
+        # forbidden indices below `start_i`
+        return reversed(self.data)
 
     def keys(self):
         return list(range(self.start_i, len(self.data) + self.start_i))
@@ -109,7 +138,7 @@ class OffsetList(collections.UserList):
         """
         Behaves similarly to calling ``enumerate()`` on a regular ``list``.
         """
-        return [(key, self[key]) for key in self.keys()]
+        return list(enumerate(self.data, start=self.start_i))
 
 
 class OneIndexedList(OffsetList):
@@ -123,12 +152,33 @@ class FlexibleSequenceDefinition(enum.Enum):
     CALLABLE = enum.auto()
 
 
+# Integer tags mirroring ``FlexibleSequenceDefinition``, for hot-path branches (comparing plain
+# ints is cheaper than comparing Enum members)
+_DIRECT = FlexibleSequenceDefinition.DIRECT.value
+_CONSTANT = FlexibleSequenceDefinition.CONSTANT.value
+_CALLABLE = FlexibleSequenceDefinition.CALLABLE.value
+
+
 class FlexibleSequence(collections.abc.Sequence):
+    # Slicing constructs a new instance per call, so keep instances compact: slots avoid the
+    # per-instance ``__dict__`` and make attribute access a fixed-offset load
+    __slots__ = (
+        "c_start_i",
+        "wrapped",
+        "definition",
+        "length",
+        "_def",
+        "_get_int",
+        "_finite",
+        "_cache",
+    )
+
     def __init__(
         self,
         spec: Union[Sequence, object, Callable],
         length: Optional[int] = None,
         callable_start_i: Optional[int] = 0,
+        memoize: bool = False,
     ):
         """
         Specify a sequence in one of three ways:
@@ -160,21 +210,43 @@ class FlexibleSequence(collections.abc.Sequence):
                 though the callable may support arguments greater than that length).
 
         :param callable_start_i: The callable argument that corresponds to the 0 index of the ``FlexibleSequence``.``flexible_seq[0]==callable(callable_start_i)``
-        """
-        if isinstance(spec, Sequence) and length and len(spec) != length:
-            raise ValueError(f"Mismatched lengths: len(spec)={len(spec)}, length={length}")
 
+        :param memoize:
+                Only relevant when supplying a callable. If ``True``, each index's value is cached on
+                first evaluation, so repeated accesses (e.g. iterating twice) call the callable only
+                once per index. Only use this for pure callables; note the cache grows without bound.
+        """
         self.c_start_i = callable_start_i
         self.wrapped = spec
 
-        if isinstance(self.wrapped, Sequence):
+        # Check the common concrete sequence types before falling back to the ``Sequence`` ABC
+        # (``isinstance`` against an ABC goes through the registry machinery); ``callable`` is a
+        # C builtin and equivalent to an ``isinstance(..., Callable)`` check
+        if isinstance(spec, (list, tuple, str, FlexibleSequence)) or isinstance(spec, Sequence):
+            if length and len(spec) != length:
+                raise ValueError(f"Mismatched lengths: len(spec)={len(spec)}, length={length}")
             self.definition = FlexibleSequenceDefinition.DIRECT
-            length = len(self.wrapped)
-        elif isinstance(self.wrapped, Callable):
+            length = len(spec)
+        elif callable(spec):
             self.definition = FlexibleSequenceDefinition.CALLABLE
         else:  # any other object
             self.definition = FlexibleSequenceDefinition.CONSTANT
 
+        self._def = self.definition.value
+
+        # The definition is fixed at construction, so install the matching ``_get_int``
+        # specialization once here, rather than branching on every integer access
+        if self._def == _DIRECT:
+            self._get_int = self._get_int_direct
+        elif self._def == _CONSTANT:
+            self._get_int = self._get_int_constant
+        elif memoize:
+            self._cache = {}
+            self._get_int = self._get_int_callable_memoized
+        else:
+            self._cache = None
+            self._get_int = self._get_int_callable
+
         if length is None:
             if self.definition == FlexibleSequenceDefinition.DIRECT:
                 self.length = len(self.wrapped)
@@ -183,20 +255,34 @@ class FlexibleSequence(collections.abc.Sequence):
         else:
             self.length = length
 
+        # ``length`` never changes after construction, so compute finiteness once
+        self._finite = math.isfinite(self.length)
+
     def __iter__(self):
-        if self.definition == FlexibleSequenceDefinition.DIRECT:
-            yield from self.wrapped.__iter__()
-        else:
-            if math.isfinite(self.length):
-                yield from (self[i] for i in range(self.length))
-            else:
-                yield from (self[i] for i in count())
+        if self._def == _DIRECT:
+            return iter(self.wrapped)
+        if self._def == _CONSTANT:
+            if self._finite:
+                return repeat(self.wrapped, self.length)
+            return repeat(self.wrapped)
+        # CALLABLE, memoized: go through ``_get_int`` so repeated iteration reuses the cache
+        if self._cache is not None:
+            get = self._get_int
+            if self._finite:
+                return (get(i) for i in range(self.length))
+            return map(get, count())
+        # CALLABLE, unmemoized: call the wrapped callable directly, skipping `_get_int`'s dispatch
+        fn = self.wrapped
+        start = self.c_start_i
+        if self._finite:
+            return (fn(start + i) for i in range(self.length))
+        return map(fn, count(start))
 
     def __len__(self):
-        if self.definition == FlexibleSequenceDefinition.DIRECT:
+        if self._def == _DIRECT:
             return len(self.wrapped)
         else:
-            if math.isfinite(self.length):
+            if self._finite:
                 return self.length
             else:
                 # We cannot return `math.inf`, as the `len` function (that calls `__len__`) needs an integer.
@@ -211,38 +297,94 @@ class FlexibleSequence(collections.abc.Sequence):
     def __eq__(self, other) -> bool:
         if other is None:
             return False
-        return [i for i in self] == [i for i in other]
+        if isinstance(other, FlexibleSequence):
+            # ``len``, not the stored ``length``: a DIRECT sequence's length is dynamic (the
+            # wrapped list may have been mutated after construction)
+            if self._finite and other._finite and len(self) != len(other):
+                return False
+            if (
+                self._def == _DIRECT
+                and other._def == _DIRECT
+                and type(self.wrapped) is type(other.wrapped)
+                and isinstance(self.wrapped, (list, tuple))
+            ):
+                # Same concrete container type on both sides: C-level comparison
+                return self.wrapped == other.wrapped
+        # Compare element by element instead of materializing both sides into lists: no O(n)
+        # allocation, and the first mismatch (including a length mismatch) exits early.
+        sentinel = object()
+        for a, b in zip_longest(self, other, fillvalue=sentinel):
+            if a is sentinel or b is sentinel:  # One side is shorter than the other
+                return False
+            if a != b:
+                return False
+        return True
+
+    # Above this many elements, ``__repr__`` shows a preview rather than materializing the whole
+    # sequence (debuggers and logging call ``repr`` implicitly, which should stay O(1))
+    _REPR_PREVIEW_THRESHOLD = 20
 
     def __repr__(self):
-        if math.isfinite(self.length):
-            return [i for i in self].__repr__()
+        if self._finite:
+            if self.length <= self._REPR_PREVIEW_THRESHOLD:
+                return repr(list(self))
+            head = ", ".join(repr(self._get_int(i)) for i in range(5))
+            tail = ", ".join(repr(self._get_int(i)) for i in range(self.length - 5, self.length))
+            return f"FlexibleSequence([{head}, ..., {tail}], length={self.length})"
         else:
             if isinstance(self.wrapped, FunctionType):
                 return f"FlexibleSequence({self.wrapped.__class__.__name__})"
             return f"FlexibleSequence({self.wrapped})"
 
-    def _get_int(self, index: int):
-        if self.definition == FlexibleSequenceDefinition.CONSTANT:
-            return self.wrapped
-        elif self.definition == FlexibleSequenceDefinition.DIRECT:
-            return self.wrapped[index]
-        elif self.definition == FlexibleSequenceDefinition.CALLABLE:
-            if index < 0:
-                if math.isinf(self.length):
-                    self._raise_negative_forbidden(index)
-                else:
-                    index = self.length + index
-            return self.wrapped(self.c_start_i + index)
+    @classmethod
+    def _from_sequence(cls, seq: Sequence) -> "FlexibleSequence":
+        """
+        Build a DIRECT ``FlexibleSequence`` around ``seq`` without re-running ``__init__``'s
+        classification checks. For internal use on sequences we have just built ourselves.
+        """
+        obj = cls.__new__(cls)
+        obj.c_start_i = 0
+        obj.wrapped = seq
+        obj.definition = FlexibleSequenceDefinition.DIRECT
+        obj._def = _DIRECT
+        obj._get_int = obj._get_int_direct
+        obj.length = len(seq)
+        obj._finite = True
+        return obj
+
+    def _get_int_constant(self, index: int):
+        return self.wrapped
+
+    def _get_int_direct(self, index: int):
+        return self.wrapped[index]
+
+    def _get_int_callable(self, index: int):
+        if index < 0:
+            if not self._finite:
+                self._raise_negative_forbidden(index)
+            else:
+                index = self.length + index
+        return self.wrapped(self.c_start_i + index)
+
+    def _get_int_callable_memoized(self, index: int):
+        if index < 0:  # Normalize before the lookup, so s[-1] and s[len(s) - 1] share an entry
+            if not self._finite:
+                self._raise_negative_forbidden(index)
+            index = self.length + index
+        cache = self._cache
+        if index in cache:
+            return cache[index]
+        value = cache[index] = self.wrapped(self.c_start_i + index)
+        return value
 
     def _get_slice(self, _slice: slice):
-        if isinstance(self.wrapped, Callable) and math.isinf(self.length):
-            with CatchNoneComparisons():
-                if _slice.start < 0:
-                    self._raise_negative_forbidden(_slice.start)
-                if _slice.stop < 0:
-                    self._raise_negative_forbidden(_slice.stop)
+        if self._def == _CALLABLE and not self._finite:
+            if _slice.start is not None and _slice.start < 0:
+                self._raise_negative_forbidden(_slice.start)
+            if _slice.stop is not None and _slice.stop < 0:
+                self._raise_negative_forbidden(_slice.stop)
 
-        if math.isfinite(self.length):
+        if self._finite:
             int_indices = range(*_slice.indices(self.length))
         else:
             self._raise_if_infinite_result(_slice)
@@ -256,13 +398,28 @@ class FlexibleSequence(collections.abc.Sequence):
 
             int_indices = range(*_slice.indices(max_length))
 
-        if self.definition == FlexibleSequenceDefinition.CONSTANT:
-            slice_length = len(int_indices)
-            return FlexibleSequence([self.wrapped] * slice_length)
-        elif self.definition == FlexibleSequenceDefinition.DIRECT:
-            return FlexibleSequence(self.wrapped[_slice])
-        elif self.definition == FlexibleSequenceDefinition.CALLABLE:
-            return FlexibleSequence([self._get_int(i) for i in int_indices])
+        if self._def == _CONSTANT:
+            # A slice of a constant sequence is itself a constant sequence: no need to
+            # materialize a list of ``slice_length`` references
+            return FlexibleSequence(self.wrapped, length=len(int_indices))
+        elif self._def == _DIRECT:
+            # The wrapped sequence's own slicing already produced a sequence; skip __init__'s
+            # re-classification
+            return FlexibleSequence._from_sequence(self.wrapped[_slice])
+        elif self._def == _CALLABLE:
+            # Memoized: route through ``_get_int`` so slices share the cache
+            if self._cache is not None:
+                get = self._get_int
+                return FlexibleSequence._from_sequence([get(i) for i in int_indices])
+            # ``int_indices`` are already non-negative here, so skip ``_get_int``'s
+            # negative-index handling and call the wrapped callable directly
+            fn = self.wrapped
+            c_start_i = self.c_start_i
+            if isinstance(fn, np.ufunc):
+                # A ufunc evaluates every index in a single vectorized call
+                indices = np.arange(int_indices.start, int_indices.stop, int_indices.step)
+                return FlexibleSequence._from_sequence(fn(indices + c_start_i).tolist())
+            return FlexibleSequence._from_sequence([fn(c_start_i + i) for i in int_indices])
 
     def _raise_if_infinite_result(self, _slice: slice):
         """
@@ -271,30 +428,28 @@ class FlexibleSequence(collections.abc.Sequence):
         It may be possible to simplify the logic here, I used a brute force approach of hacking around until all tests
         passed...
         """
+        start, stop = _slice.start, _slice.stop
         step = _slice.step if _slice.step is not None else 1
         exception = IndexError(
             f"The result of slicing an infinite `FlexibleSequence` with [{_slice.start}:{_slice.stop}:{_slice.step}] would be infinite."
         )
 
-        with CatchNoneComparisons():
-            if _slice.start is None and _slice.stop is None:
+        if start is None and stop is None:
+            raise exception
+
+        if step > 0:
+            if stop is None:
+                if start >= 0:  # ``start`` is not None here: the both-None case raised above
+                    raise exception
+            elif (start is None or start >= 0) and stop < 0:
                 raise exception
 
-            if step > 0:
-                if _slice.stop is None:
-                    if _slice.start >= 0:
-                        raise exception
-                if (_slice.start is None) or (_slice.start >= 0):
-                    if _slice.stop < 0:
-                        raise exception
-
-            if step < 0:
-                if _slice.start is None:
-                    if _slice.stop >= 0:
-                        raise exception
-                if _slice.start < 0:
-                    if (_slice.stop is None) or (_slice.stop >= 0):
-                        raise exception
+        if step < 0:
+            if start is None:
+                if stop >= 0:  # ``stop`` is not None here: the both-None case raised above
+                    raise exception
+            elif start < 0 and (stop is None or stop >= 0):
+                raise exception
 
     def _raise_negative_forbidden(self, index):
         raise NotImplementedError(
@@ -4,56 +4,58 @@ import numpy as np
 
 
 def is_geometric_sequence(sequence: Sequence) -> bool:
-    sequence = np.asarray(sequence)
-    if np.any(sequence == 0):
+    # Contiguous float64 input lets NumPy's vectorized inner loops do the work; non-numeric
+    # (e.g. object-dtype) sequences are rejected by the cast rather than silently taking a slow
+    # object-dtype path
+    sequence = np.ascontiguousarray(sequence, dtype=np.float64)
+    if not sequence.all():  # Any zero element; avoids allocating the ``sequence == 0`` mask
         return False
     if len(sequence) == 0:
         raise IndexError("Sequence of length 0")
     if len(sequence) == 1:
         return True
 
-    common_ratio = sequence[1] / sequence[0]
-    for i in range(1, len(sequence)):
-        ratio = sequence[i] / sequence[i - 1]
-        if not np.isclose(ratio, common_ratio):
-            return False
-    return True
+    # Test in log-space: the sequence is geometric iff the log of the absolute values advances by
+    # a constant step and the sign pattern is consistent. Unlike dividing adjacent pairs, this
+    # cannot overflow or underflow for extreme magnitudes.
+    log_steps = np.diff(np.log(np.abs(sequence)))
+    ratio_signs = np.sign(sequence[1:]) * np.sign(sequence[:-1])
+    return bool(np.all(ratio_signs == ratio_signs[0]) and np.allclose(log_steps, log_steps[0]))
 
 
 def is_arithmetic_sequence(sequence: Sequence) -> bool:
-    sequence = np.asarray(sequence)
+    sequence = np.ascontiguousarray(sequence, dtype=np.float64)
     if len(sequence) == 0:
         raise IndexError("Sequence of length 0")
     if len(sequence) == 1:
         return True
-    diff = np.diff(sequence)
-    common_difference = diff[0]
-    return np.all(np.isclose(diff, common_difference))
+    common_difference = sequence[1] - sequence[0]
+    return bool(np.allclose(sequence[1:] - sequence[:-1], common_difference))
 
 
 def is_increasing(sequence: Sequence) -> bool:
-    sequence = np.asarray(sequence)
+    sequence = np.ascontiguousarray(sequence, dtype=np.float64)
     if len(sequence) == 0:
         raise IndexError("Sequence of length 0")
     return np.all(np.diff(sequence) > 0)
 
 
 def is_non_decreasing(sequence: Sequence) -> bool:
-    sequence = np.asarray(sequence)
+    sequence = np.ascontiguousarray(sequence, dtype=np.float64)
     if len(sequence) == 0:
         raise IndexError("Sequence of length 0")
     return np.all(np.diff(sequence) >= 0)
 
 
 def is_decreasing(sequence: Sequence) -> bool:
-    sequence = np.asarray(sequence)
+    sequence = np.ascontiguousarray(sequence, dtype=np.float64)
     if len(sequence) == 0:
         raise IndexError("Sequence of length 0")
     return np.all(np.diff(sequence) < 0)
 
 
 def is_non_increasing(sequence: Sequence) -> bool:
-    sequence = np.asarray(sequence)
+    sequence = np.ascontiguousarray(sequence, dtype=np.float64)
     if len(sequence) == 0:
         raise IndexError("Sequence of length 0")
     return np.all(np.diff(sequence) <= 0)
@@ -3,6 +3,10 @@ from typing import Optional
 
 import codetiming
 
+# Text templates by timer name: repeatedly constructing a Timer with the same name (e.g. inside a
+# loop) reuses the formatted template instead of rebuilding it
+_TEMPLATE_CACHE = {}
+
 
 @dataclass
 class Timer(codetiming.Timer):
@@ -14,4 +18,7 @@ class Timer(codetiming.Timer):
 
     def __post_init__(self):
         if self.name is not None:
-            self.text = f"'{self.name}' elapsed time: {{:.4f}} seconds"
+            text = _TEMPLATE_CACHE.get(self.name)
+            if text is None:
+                text = _TEMPLATE_CACHE[self.name] = f"'{self.name}' elapsed time: {{:.4f}} seconds"
+            self.text = text
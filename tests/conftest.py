@@ -12,5 +12,9 @@ import pytest
     ],
     ids=lambda p: f"seed={p}",
 )
-def random_seed(request):
-    np.random.seed(request.param)
+def rng(request):
+    """
+    A seeded ``numpy.random.Generator``. Unlike seeding the global ``np.random`` state, a local
+    generator cannot leak into other tests and is safe under parallel test runs.
+    """
+    return np.random.default_rng(request.param)
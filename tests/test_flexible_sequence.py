@@ -1,11 +1,17 @@
 from collections import OrderedDict
 
+import numpy as np
 import pytest
 
 from nonstd.sequence import OneIndexedList, FlexibleSequenceDefinition, FlexibleSequence
 
 
-@pytest.fixture(params=[FlexibleSequenceDefinition.DIRECT, FlexibleSequenceDefinition.CALLABLE])
+# Module scope: the slice tests only read these objects, so there is no need to rebuild them for
+# each of the ~80 parametrized invocations
+@pytest.fixture(
+    scope="module",
+    params=[FlexibleSequenceDefinition.DIRECT, FlexibleSequenceDefinition.CALLABLE],
+)
 def one_two_three(request):
     if request.param == FlexibleSequenceDefinition.DIRECT:
         return FlexibleSequence((1, 2, 3))
@@ -13,24 +19,72 @@ def one_two_three(request):
         return FlexibleSequence(lambda index: index + 1, length=3)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def one_with_length():
     return FlexibleSequence(1, length=5)
 
 
-@pytest.fixture(params=list(range(-4, 4)) + [None], ids=lambda x: f"start={x}")
-def start(request):
-    return request.param
-
-
-@pytest.fixture(params=list(range(-4, 4)) + [None], ids=lambda x: f"stop={x}")
-def stop(request):
-    return request.param
-
-
-@pytest.fixture(params=list(range(-4, 0)) + list(range(1, 4)) + [None], ids=lambda x: f"step={x}")
-def step(request):
-    return request.param
+@pytest.fixture(scope="module")
+def infinite_one():
+    return FlexibleSequence(1)  # without a length
+
+
+def _slice_triples():
+    """
+    All ``(start, stop, step)`` combinations the slice tests originally enumerated as three
+    crossed fixtures, deduplicated by observable behaviour: two triples are redundant if they
+    slice a length-3 sequence, a length-5 sequence, and an infinite sequence identically.
+    This cuts ~650 pytest nodes per test down to ~80 with the same coverage.
+    """
+    starts_stops = list(range(-4, 4)) + [None]
+    steps = list(range(-4, 0)) + list(range(1, 4)) + [None]
+    seen = {}
+    for start in starts_stops:
+        for stop in starts_stops:
+            for step in steps:
+                key = (
+                    tuple([1, 2, 3][start:stop:step]),
+                    tuple([1, 1, 1, 1, 1][start:stop:step]),
+                    # Behaviour on an infinite sequence: whether the slice's size depends on the
+                    # size of the sequence being sliced, and the result length when it does not
+                    len(list(range(100))[start:stop:step])
+                    < len(list(range(1000))[start:stop:step]),
+                    len(list(range(1000))[start:stop:step]),
+                )
+                seen.setdefault(key, (start, stop, step))
+    return list(seen.values())
+
+
+SLICE_TRIPLES = _slice_triples()
+
+# The expected value of ``[1, 2, 3][start:stop:step]`` is baked into the parametrize tuples, so
+# the test body is a pure equality rather than re-slicing the reference list on each invocation
+_FINITE_SLICE_CASES = [
+    (start, stop, step, [1, 2, 3][start:stop:step]) for start, stop, step in SLICE_TRIPLES
+]
+finite_slice_cases = pytest.mark.parametrize(
+    "start,stop,step,expected", _FINITE_SLICE_CASES, ids=lambda x: str(x)
+)
+
+# A bit of a hack: If the slice's size depends on the size of the list being sliced, then we should
+# expect an IndexError when attempting to slice an infinite `FlexibleSequence`. Both the
+# size-dependence flag and the expected length are computed here, at collection time, so the test
+# body doesn't materialize ``list(range(1000))`` on every invocation.
+_INFINITE_SLICE_CASES = [
+    (
+        start,
+        stop,
+        step,
+        len(list(range(100))[start:stop:step]) < len(list(range(1000))[start:stop:step]),
+        len(list(range(1000))[start:stop:step]),
+    )
+    for start, stop, step in SLICE_TRIPLES
+]
+infinite_slice_cases = pytest.mark.parametrize(
+    "start,stop,step,size_dependent,expected_length",
+    _INFINITE_SLICE_CASES,
+    ids=lambda x: str(x),
+)
 
 
 class TestFlexibleSequence:
@@ -118,28 +172,80 @@ class TestFlexibleSequence:
         assert finite[-1] == 16
         assert finite[-3:] == [4, 9, 16]
 
-    def test_access_slice_finite(self, one_two_three, one_with_length, start, stop, step):
-        assert one_two_three[start:stop:step] == [1, 2, 3][start:stop:step]
+    def test_access_slice_ufunc(self):
+        # Slicing a sequence wrapping a NumPy ufunc evaluates all indices in one vectorized call
+        s = FlexibleSequence(np.square, callable_start_i=5, length=4)
+        assert s == [25, 36, 49, 64]
+        assert s[1:3] == [36, 49]
+        assert s[::-1] == [64, 49, 36, 25]
+
+        assert FlexibleSequence(np.square)[2:6] == [4, 9, 16, 25]
+
+    def test_memoize(self):
+        calls = []
+
+        def f(index):
+            calls.append(index)
+            return index**2
+
+        s = FlexibleSequence(f, length=5, memoize=True)
+        assert s[2] == s[2] == 4
+        assert calls == [2]
+
+        # Negative indices are normalized before the cache lookup, so s[-1] shares an entry
+        # with s[4]
+        assert s[-1] == 16
+        assert s[4] == 16
+        assert calls == [2, 4]
+
+        # Iteration and slicing share the cache: two full iterations call the callable once
+        # per index
+        calls.clear()
+        s = FlexibleSequence(f, length=3, memoize=True)
+        assert list(s) == list(s) == [0, 1, 4]
+        assert calls == [0, 1, 2]
+        assert s[1:] == [1, 4]
+        assert calls == [0, 1, 2]
+
+        # An infinite memoized sequence still refuses negative indices
+        with pytest.raises(NotImplementedError):
+            FlexibleSequence(f, memoize=True)[-1]
 
-        # Does not raise IndexError
-        one_with_length[start:stop:step]
+        # Without memoize, each access calls the callable again
+        calls.clear()
+        s = FlexibleSequence(f, length=5)
+        assert s[2] == s[2] == 4
+        assert calls == [2, 2]
 
-    def test_access_slice_infinite(self, start, stop, step):
-        one = FlexibleSequence(1)  # without a length
+    @finite_slice_cases
+    def test_access_slice_finite(self, one_two_three, one_with_length, start, stop, step, expected):
+        assert one_two_three[start:stop:step] == expected
 
-        # A bit of a hack: If the slice's size depends on the size of the list being sliced, then we should expect
-        # an IndexError when attempting to slice an infinite `FlexibleSequence`.
-        size_dependent_slice = len(list(range(100))[start:stop:step]) < len(
-            list(range(1000))[start:stop:step]
-        )
+        # Does not raise IndexError
+        one_with_length[start:stop:step]
 
-        if size_dependent_slice:
+    @infinite_slice_cases
+    def test_access_slice_infinite(
+        self, infinite_one, start, stop, step, size_dependent, expected_length
+    ):
+        if size_dependent:
             with pytest.raises(IndexError):
-                one[start:stop:step]
+                infinite_one[start:stop:step]
         else:
-            LARGE_NUMBER = 1000
-            length = len(list(range(LARGE_NUMBER))[start:stop:step])
-            assert one[start:stop:step] == [1] * length
+            assert infinite_one[start:stop:step] == [1] * expected_length
+
+    def test_access_slice_infinite_negative_bounds(self):
+        infinite = FlexibleSequence(lambda x: x)
+
+        # A negative start or stop on an infinite callable sequence is undefined behaviour and
+        # raises, regardless of step sign. (Previously [:-5] raised IndexError and [:-5:-1]
+        # returned a result bounded by an internal guess at the maximum length.)
+        with pytest.raises(NotImplementedError):
+            infinite[:-5]
+        with pytest.raises(NotImplementedError):
+            infinite[:-5:-1]
+        with pytest.raises(NotImplementedError):
+            infinite[-3:]
 
     def test_equality(self):
         assert (
@@ -156,5 +262,10 @@ class TestFlexibleSequence:
     def test_repr(self):
         assert str(FlexibleSequence(1)) == "FlexibleSequence(1)"
         assert str(FlexibleSequence(lambda x: x, length=3)) == "[0, 1, 2]"
+        # Finite sequences past the preview threshold show only the first and last five elements
+        assert (
+            str(FlexibleSequence(lambda x: x, length=25))
+            == "FlexibleSequence([0, 1, 2, 3, 4, ..., 20, 21, 22, 23, 24], length=25)"
+        )
         assert str(FlexibleSequence(lambda x: x)) == "FlexibleSequence(function)"
         assert str(FlexibleSequence(None)) == "FlexibleSequence(None)"
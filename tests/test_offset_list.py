@@ -3,6 +3,30 @@ import pytest
 from nonstd.sequence import OneIndexedList, OffsetList
 
 
+@pytest.fixture(scope="class")
+def one_two_three():
+    return OneIndexedList([1, 2, 3])
+
+
+# (slice, expected) pairs for slicing OneIndexedList([1, 2, 3]); built once at import so the test
+# doesn't reconstruct the expected OneIndexedList on every assertion
+SLICE_CASES = [
+    (slice(1, 2), OneIndexedList([1])),
+    (slice(None, 2), OneIndexedList([1])),
+    (slice(2, 4), OneIndexedList([2, 3])),
+    (slice(2, None), OneIndexedList([2, 3])),
+    (slice(1, 3), OneIndexedList([1, 2])),
+    (slice(None, 4), OneIndexedList([1, 2, 3])),
+    (slice(None, 1), OneIndexedList([])),
+    (slice(None, 4, 2), OneIndexedList([1, 3])),
+    (slice(1, 4, 2), OneIndexedList([1, 3])),
+    (slice(-2, None), OneIndexedList([2, 3])),
+    (slice(None, -2), OneIndexedList([1])),
+    (slice(None, None, -1), OneIndexedList([3, 2, 1])),
+    (slice(2, None, -1), OneIndexedList([2, 1])),
+]
+
+
 class TestOneIndexedList:
     """
     Tests all the ``list`` methods noted here [1], i.e.:
@@ -107,6 +131,10 @@ class TestOneIndexedList:
         oil.reverse()
         assert oil == OneIndexedList([3, 2, 1])
 
+    def test_reversed(self):
+        oil = OneIndexedList([1, 2, 3])
+        assert list(reversed(oil)) == [3, 2, 1]
+
     def test_copy(self):
         oil = OneIndexedList([1])
         oil2 = oil.copy()
@@ -126,27 +154,9 @@ class TestOneIndexedList:
         assert oil[-1] == 2
         assert oil[-2] == 1
 
-    def test_access_slice(self):
-        oil = OneIndexedList([1, 2, 3])
-        assert oil[1:2] == OneIndexedList([1])
-        assert oil[:2] == OneIndexedList([1])
-
-        assert oil[2:4] == OneIndexedList([2, 3])
-        assert oil[2:] == OneIndexedList([2, 3])
-
-        assert oil[1:3] == OneIndexedList([1, 2])
-
-        assert oil[:4] == OneIndexedList([1, 2, 3])
-        assert oil[:1] == OneIndexedList([])
-
-        assert oil[:4:2] == OneIndexedList([1, 3])
-        assert oil[1:4:2] == OneIndexedList([1, 3])
-
-        assert oil[-2:] == OneIndexedList([2, 3])
-        assert oil[:-2] == OneIndexedList([1])
-
-        assert oil[::-1] == OneIndexedList([3, 2, 1])
-        assert oil[2::-1] == OneIndexedList([2, 1])
+    @pytest.mark.parametrize("_slice,expected", SLICE_CASES, ids=lambda x: str(x))
+    def test_access_slice(self, one_two_three, _slice, expected):
+        assert one_two_three[_slice] == expected
 
     def test_equality(self):
         assert OneIndexedList() == OneIndexedList()
@@ -10,61 +10,98 @@ from nonstd.sequence_math import (
 )
 
 
-def test_is_geometric_sequence():
-    assert is_geometric_sequence([1])
-    assert is_geometric_sequence([1, 1, 1])
-    assert is_geometric_sequence([1, 2, 4])
-    assert is_geometric_sequence([-1, 1, -1])
-
-    assert not is_geometric_sequence([0])
-    assert not is_geometric_sequence([0, 1, 1])
-    assert not is_geometric_sequence([1, 2, 3])
-
-    with pytest.raises(IndexError):
-        is_geometric_sequence([])
-
-
-def test_is_arithmetic_sequence():
-    assert is_arithmetic_sequence([0])
-    assert is_arithmetic_sequence([0, 0, 0])
-    assert is_arithmetic_sequence([0, 1, 2])
-    assert is_arithmetic_sequence([3, 2, 1])
-
-    assert not is_arithmetic_sequence([1, 2, 4])
-
-    with pytest.raises(IndexError):
-        is_arithmetic_sequence([])
-
-
-def test_is_increasing_sequence():
-    assert is_increasing([0])
-    assert is_increasing([0, 1, 2])
-    assert is_increasing([1, 2, 4])
-    assert not is_increasing([3, 2, 1])
-    with pytest.raises(IndexError):
-        is_increasing([])
-
-
-def test_is_non_decreasing_sequence():
-    assert is_non_decreasing([0])
-    assert is_non_decreasing([0, 1, 2])
-    assert is_non_decreasing([0, 0, 0])
-    assert not is_non_decreasing([3, 2, 1])
-    with pytest.raises(IndexError):
-        is_non_decreasing([])
+@pytest.mark.parametrize(
+    "sequence,expected",
+    [
+        ([1], True),
+        ([1, 1, 1], True),
+        ([1, 2, 4], True),
+        ([-1, 1, -1], True),
+        ([0], False),
+        ([0, 1, 1], False),
+        ([1, 2, 3], False),
+    ],
+)
+def test_is_geometric_sequence(sequence, expected):
+    assert is_geometric_sequence(sequence) == expected
+
+
+@pytest.mark.parametrize(
+    "sequence,expected",
+    [
+        ([0], True),
+        ([0, 0, 0], True),
+        ([0, 1, 2], True),
+        ([3, 2, 1], True),
+        ([1, 2, 4], False),
+    ],
+)
+def test_is_arithmetic_sequence(sequence, expected):
+    assert is_arithmetic_sequence(sequence) == expected
+
+
+@pytest.mark.parametrize(
+    "sequence,expected",
+    [
+        ([0], True),
+        ([0, 1, 2], True),
+        ([1, 2, 4], True),
+        ([3, 2, 1], False),
+    ],
+)
+def test_is_increasing_sequence(sequence, expected):
+    assert is_increasing(sequence) == expected
+
+
+@pytest.mark.parametrize(
+    "sequence,expected",
+    [
+        ([0], True),
+        ([0, 1, 2], True),
+        ([0, 0, 0], True),
+        ([3, 2, 1], False),
+    ],
+)
+def test_is_non_decreasing_sequence(sequence, expected):
+    assert is_non_decreasing(sequence) == expected
 
 
-def test_is_decreasing_sequence():
-    assert is_decreasing([3, 2, 1])
-    assert not is_decreasing([0, 1, 2])
-    assert not is_decreasing([0, 0, 0])
-    with pytest.raises(IndexError):
-        is_decreasing([])
+@pytest.mark.parametrize(
+    "sequence,expected",
+    [
+        ([3, 2, 1], True),
+        ([0, 1, 2], False),
+        ([0, 0, 0], False),
+    ],
+)
+def test_is_decreasing_sequence(sequence, expected):
+    assert is_decreasing(sequence) == expected
 
 
-def test_is_non_increasing_sequence():
-    assert is_non_increasing([3, 2, 1])
-    assert is_non_increasing([3, 3, 3])
-    assert not is_non_increasing([1, 2, 3])
+@pytest.mark.parametrize(
+    "sequence,expected",
+    [
+        ([3, 2, 1], True),
+        ([3, 3, 3], True),
+        ([1, 2, 3], False),
+    ],
+)
+def test_is_non_increasing_sequence(sequence, expected):
+    assert is_non_increasing(sequence) == expected
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        is_geometric_sequence,
+        is_arithmetic_sequence,
+        is_increasing,
+        is_non_decreasing,
+        is_decreasing,
+        is_non_increasing,
+    ],
+    ids=lambda f: f.__name__,
+)
+def test_empty_sequence_raises(function):
     with pytest.raises(IndexError):
-        is_non_increasing([])
+        function([])